@@ -0,0 +1,24 @@
+"""
+Generation counters for list caches.
+
+A list cache builds the current generation into its keys. Invalidating it
+bumps the counter (one INCR) and lets the old entries expire on their TTL,
+instead of SCANning the shared Redis keyspace for them.
+"""
+import time
+
+from django.core.cache import cache
+
+
+def get_generation(key):
+    # A missing counter (first use, or evicted) restarts at a fresh value so
+    # it can't line up with keys from an earlier generation
+    return cache.get_or_set(key, time.time_ns, timeout=None)
+
+
+def bump_generation(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # No counter yet: the next get_generation() starts a fresh one
+        pass
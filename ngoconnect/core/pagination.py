@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Cursor pagination keyed on the primary key.
+    Each page is an index range scan instead of an OFFSET over a sorted table.
+    """
+    page_size = 50
+    ordering = 'id'
+
+
+class StandardPageNumberPagination(PageNumberPagination):
+    """Page-number pagination for admin lists that need ?page=N."""
+    page_size = 50
@@ -0,0 +1,17 @@
+# core/tasks.py
+from celery import shared_task
+from user.email_service import EmailService
+from user.tasks import EMAIL_TASK_OPTIONS, send_to_each_recipient
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def notify_admins_of_contact_message(self, sender_name, sender_email, subject, message, recipient_emails):
+    """Send a Contact Us message to every admin/manager over one SMTP connection."""
+    send_to_each_recipient(
+        self,
+        recipient_emails,
+        lambda recipient_email, connection: EmailService.send_contact_notification(
+            sender_name, sender_email, subject, message, recipient_email, connection=connection
+        ),
+        retry_args=(sender_name, sender_email, subject, message),
+    )
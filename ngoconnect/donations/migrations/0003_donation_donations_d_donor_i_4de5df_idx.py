@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donations', '0002_donation_payment_gateway_response_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['donor', '-timestamp'], name='donations_d_donor_i_4de5df_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donations', '0003_donation_donations_d_donor_i_4de5df_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='donation',
+            name='donations_d_donor_i_4de5df_idx',
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['donor', '-timestamp', '-id'], name='donations_d_donor_i_c04226_idx'),
+        ),
+    ]
@@ -34,6 +34,7 @@ class Donation(models.Model):
         indexes = [
             models.Index(fields=['status', 'timestamp']),
             models.Index(fields=['campaign', 'status']),
+            models.Index(fields=['donor', '-timestamp', '-id']),
         ]
 
     def __str__(self):
@@ -1,6 +1,8 @@
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import dj_database_url
 import structlog
@@ -91,9 +93,17 @@ DATABASE_URL = os.environ.get('DATABASE_URL')
 # print('secret key:', SECRET_KEY)
 
 # print("DATABASE_URL:", DATABASE_URL)
+# Persistent connections: reuse one connection per worker thread instead of
+# reconnecting on every request; health checks discard dead ones before reuse.
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', '60'))
+
 if DATABASE_URL:
     DATABASES = {
-        'default': dj_database_url.config(default=DATABASE_URL, conn_max_age=0) # Set to 0 for stability in dev/docker
+        'default': dj_database_url.config(
+            default=DATABASE_URL,
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=True,
+        )
     }
 else:
     DATABASES = {
@@ -104,7 +114,8 @@ else:
             'USER': os.environ.get('DB_USER'),
             'PASSWORD': os.environ.get('DB_PASS'),
             'PORT': os.environ.get('DB_PORT', '5432'),
-            'CONN_MAX_AGE': 0, # Set to 0 for stability in dev/docker
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
         }
     }
 
@@ -113,9 +124,46 @@ REDIS_URL = os.environ.get('REDIS_URL', os.environ.get('CELERY_BROKER_URL', 'red
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': REDIS_URL,
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        },
+    }
+}
+
+# `manage.py test` uses its own Redis database, which the tests flush, so a run
+# neither reads nor wipes the cached pages, throttle counters and OTPs of the
+# dev server sharing the same Redis
+if sys.argv[1:2] == ['test']:
+    CACHES['default']['LOCATION'] = os.environ.get(
+        'TEST_REDIS_URL', urlsplit(REDIS_URL)._replace(path='/15').geturl()
+    )
+
+# Keep SMTP-bound work on its own queue so slow mail delivery can't starve other tasks
+CELERY_TASK_ROUTES = {
+    'user.tasks.send_*': {'queue': 'email_queue'},
+    'volunteers.tasks.*': {'queue': 'email_queue'},
+    'core.tasks.*': {'queue': 'email_queue'},
+}
+
+CELERY_BEAT_SCHEDULE = {
+    'cleanup-expired-tokens': {
+        'task': 'user.tasks.cleanup_expired_tokens',
+        'schedule': timedelta(minutes=5),
+    },
+}
+
+# Trusted reverse proxies in front of the app (e.g. 1 on Render). Throttles take the
+# client IP from X-Forwarded-For only past these hops; 0 means REMOTE_ADDR.
+NUM_PROXIES = int(os.environ.get('NUM_PROXIES', '0'))
+
 REST_FRAMEWORK = {
+    'NUM_PROXIES': NUM_PROXIES,
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'user.authentication.RedisJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -175,7 +223,7 @@ SPECTACULAR_SETTINGS = {
     },
     'SECURITY': [{'Bearer': []}],
     'AUTHENTICATION_WHITELIST': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'user.authentication.RedisJWTAuthentication',
     ],
 }
 
@@ -19,11 +19,17 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+schema_view = SpectacularAPIView.as_view()
+if not settings.DEBUG:
+    # The schema only changes on deploy; don't re-introspect every view per hit
+    schema_view = cache_page(60 * 60, key_prefix='schema')(schema_view)
+
 urlpatterns = [
     path("api/admin/", admin.site.urls),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", schema_view, name="schema"),
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(url_name="schema"),
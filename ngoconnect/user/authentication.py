@@ -0,0 +1,21 @@
+# user/authentication.py
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .tokens import is_jti_blacklisted
+
+
+class RedisJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that also rejects access tokens revoked at logout."""
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if is_jti_blacklisted(token[api_settings.JTI_CLAIM]):
+            raise InvalidToken("Token is blacklisted")
+        return token
+
+
+class RedisJWTAuthenticationScheme(SimpleJWTScheme):
+    target_class = 'user.authentication.RedisJWTAuthentication'
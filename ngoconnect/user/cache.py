@@ -0,0 +1,39 @@
+# user/cache.py
+"""Short-lived Redis caches for user read endpoints."""
+from core.cache import bump_generation, get_generation
+from django.core.cache import cache
+
+from .models import User
+
+ADMIN_EMAILS_CACHE_KEY = "users:admin_emails"
+ADMIN_EMAILS_CACHE_TTL = 300
+ADMIN_ROLES = ('admin', 'manager')
+
+USER_LIST_CACHE_TTL = 60
+USER_LIST_GENERATION_KEY = "users:list:gen"
+
+
+def get_admin_emails():
+    """Emails of active admins/managers, who are notified of applications and contact messages."""
+    emails = cache.get(ADMIN_EMAILS_CACHE_KEY)
+    if emails is None:
+        emails = list(
+            User.objects.filter(role__in=ADMIN_ROLES, is_active=True).values_list('email', flat=True)
+        )
+        cache.set(ADMIN_EMAILS_CACHE_KEY, emails, ADMIN_EMAILS_CACHE_TTL)
+    return emails
+
+
+def invalidate_admin_emails():
+    cache.delete(ADMIN_EMAILS_CACHE_KEY)
+
+
+def user_list_cache_key(cursor):
+    """One entry per cursor page; the first page has no cursor."""
+    generation = get_generation(USER_LIST_GENERATION_KEY)
+    return f"users:list:{generation}:{cursor or 'first'}"
+
+
+def invalidate_user_list():
+    bump_generation(USER_LIST_GENERATION_KEY)
+
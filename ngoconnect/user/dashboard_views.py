@@ -36,7 +36,7 @@ class DashboardSummaryView(APIView):
         
         elif role == 'volunteer':
             try:
-                profile = VolunteerProfile.objects.get(user=request.user)
+                profile = request.user.volunteer_profile
                 status = profile.application_status
             except VolunteerProfile.DoesNotExist:
                 status = "NOT_APPLIED"
@@ -72,12 +72,15 @@ NGOConnect Team
             return EmailService.send_email(user_email, subject, text_body, html_body)
             
         except Exception as e:
-            logger.error(f"OTP email sending failed: {str(e)}")
+            logger.error("OTP email sending failed: %s", e)
             return False
     
     @staticmethod
-    def send_email(to_email, subject, text_body, html_body=None):
-        """Base method to send emails (using SMTP directly)."""
+    def send_email(to_email, subject, text_body, html_body=None, connection=None):
+        """
+        Base method to send emails (using SMTP directly).
+        Pass an open `connection` to reuse one SMTP session across several sends.
+        """
         try:
             send_mail(
                 subject=subject,
@@ -86,11 +89,12 @@ NGOConnect Team
                 recipient_list=[to_email],
                 html_message=html_body,
                 fail_silently=False,
+                connection=connection,
             )
-            logger.info(f"Email sent successfully to {to_email}")
+            logger.info("Email sent successfully to %s", to_email)
             return True
         except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {str(e)}")
+            logger.error("Failed to send email to %s: %s", to_email, e)
             return False
     
     @staticmethod
@@ -155,7 +159,7 @@ NGOConnect Team
             return EmailService.send_email(user_email, subject, text_body, html_body)
             
         except Exception as e:
-            logger.error(f"Verification email sending failed: {str(e)}")
+            logger.error("Verification email sending failed: %s", e)
             return False
     
     @staticmethod
@@ -221,7 +225,7 @@ NGOConnect Team
             return EmailService.send_email(user_email, subject, text_body, html_body)
             
         except Exception as e:
-            logger.error(f"Password reset email sending failed: {str(e)}")
+            logger.error("Password reset email sending failed: %s", e)
             return False
     
     @staticmethod
@@ -246,7 +250,7 @@ NGOConnect Team
             return EmailService.send_email(user_email, subject, text_body)
             
         except Exception as e:
-            logger.error(f"Welcome email sending failed: {str(e)}")
+            logger.error("Welcome email sending failed: %s", e)
             return False
 
     @staticmethod
@@ -325,11 +329,11 @@ NGOConnect Team
             return False
             
         except Exception as e:
-            logger.error(f"Donation receipt email sending failed: {str(e)}")
+            logger.error("Donation receipt email sending failed: %s", e)
             return False
 
     @staticmethod
-    def send_contact_notification(sender_name, sender_email, subject, message, recipient_email):
+    def send_contact_notification(sender_name, sender_email, subject, message, recipient_email, connection=None):
         """Send contact us notification to admin/manager."""
         try:
             email_subject = f"New Contact Message: {subject}"
@@ -345,14 +349,14 @@ Message:
 {message}
             """
             
-            return EmailService.send_email(recipient_email, email_subject, text_body)
+            return EmailService.send_email(recipient_email, email_subject, text_body, connection=connection)
             
         except Exception as e:
-            logger.error(f"Contact notification failed: {str(e)}")
+            logger.error("Contact notification failed: %s", e)
             return False
 
     @staticmethod
-    def send_volunteer_application_notification(applicant_name, applicant_email, recipient_email):
+    def send_volunteer_application_notification(applicant_name, applicant_email, recipient_email, connection=None):
         """Notify admin/manager about a new volunteer application."""
         try:
             subject = "New Volunteer Application - NGOConnect"
@@ -370,9 +374,9 @@ Please log in to the admin panel to review the application.
 Best regards,
 NGOConnect Team
             """
-            return EmailService.send_email(recipient_email, subject, text_body)
+            return EmailService.send_email(recipient_email, subject, text_body, connection=connection)
         except Exception as e:
-            logger.error(f"Volunteer app notification failed: {str(e)}")
+            logger.error("Volunteer app notification failed: %s", e)
             return False
 
     @staticmethod
@@ -399,7 +403,7 @@ NGOConnect Team
             """
             return EmailService.send_email(applicant_email, subject, text_body)
         except Exception as e:
-            logger.error(f"Volunteer status update email failed: {str(e)}")
+            logger.error("Volunteer status update email failed: %s", e)
             return False
 
 
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0008_alter_user_email'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emailverificationtoken',
+            name='token',
+            field=models.CharField(max_length=43, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='passwordresettoken',
+            name='token',
+            field=models.CharField(max_length=43, unique=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0011_alter_emailverificationtoken_token_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='user',
+            options={'ordering': ['id'], 'verbose_name': 'user', 'verbose_name_plural': 'users'},
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+
+def copy_blacklist_to_redis(apps, schema_editor):
+    """
+    Carry tokens revoked under the token_blacklist tables over to the
+    jti:blacklist:<jti> keys that user.tokens now checks, each expiring
+    when its token does. Without this, refresh tokens logged out or
+    rotated away before the switch would be accepted again.
+    """
+    BlacklistedToken = apps.get_model('token_blacklist', 'BlacklistedToken')
+    now = timezone.now()
+    revoked = BlacklistedToken.objects.filter(token__expires_at__gt=now).values_list(
+        'token__jti', 'token__expires_at'
+    )
+    pipe = None
+    for jti, expires_at in revoked.iterator():
+        ttl = int((expires_at - now).total_seconds())
+        if ttl > 0:
+            if pipe is None:
+                pipe = get_redis_connection("default").pipeline(transaction=False)
+            pipe.setex(f"jti:blacklist:{jti}", ttl, 1)
+    if pipe is not None:
+        pipe.execute()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0012_alter_user_options'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_blacklist_to_redis, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 # user/models.py
+import hashlib
 import secrets
 from datetime import timedelta
 
@@ -8,6 +9,11 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
+def hash_token(raw_token):
+    """SHA-256 hex digest used to look up emailed tokens."""
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+
 class UserManager(BaseUserManager):
     """Custom manager to handle email as the unique identifier."""
     def create_user(self, email, password=None, **extra_fields):
@@ -56,6 +62,7 @@ class User(AbstractUser):
     class Meta:
         verbose_name = _('user')
         verbose_name_plural = _('users')
+        ordering = ['id']
         indexes = [
             models.Index(fields=['role']),
         ]
@@ -82,7 +89,7 @@ class User(AbstractUser):
 class EmailVerificationToken(models.Model):
     """Token for email verification during registration."""
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    token = models.CharField(max_length=64, unique=True)
+    token = models.CharField(max_length=43, unique=True)  # len(token_urlsafe(32))
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
@@ -107,13 +114,19 @@ class EmailVerificationToken(models.Model):
     def is_valid(self):
         return not self.is_used and not self.is_expired
     
+    @classmethod
+    def cleanup_expired(cls):
+        """Delete all expired rows in a single query; returns the number deleted."""
+        deleted, _ = cls.objects.filter(expires_at__lt=timezone.now()).delete()
+        return deleted
+    
     def __str__(self):
         return f"Email verification token for {self.user.email}"
 
 
 class PasswordResetToken(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    token = models.CharField(max_length=64, unique=True)
+    token = models.CharField(max_length=43, unique=True)  # len(token_urlsafe(32))
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
@@ -133,6 +146,12 @@ class PasswordResetToken(models.Model):
     def is_valid(self):
         return not self.is_used and not self.is_expired
     
+    @classmethod
+    def cleanup_expired(cls):
+        """Delete all expired rows in a single query; returns the number deleted."""
+        deleted, _ = cls.objects.filter(expires_at__lt=timezone.now()).delete()
+        return deleted
+    
     def __str__(self):
         return f"Password reset token for {self.user.email}"
     
@@ -157,5 +176,11 @@ class EmailOtp(models.Model):
     def is_valid(self, otp):
         return timezone.now() < self.expires_at and self.attempts < 5
     
+    @classmethod
+    def cleanup_expired(cls):
+        """Delete all expired rows in a single query; returns the number deleted."""
+        deleted, _ = cls.objects.filter(expires_at__lt=timezone.now()).delete()
+        return deleted
+    
     def __str__(self):
         return f"{self.user.email} - {self.otp}"
\ No newline at end of file
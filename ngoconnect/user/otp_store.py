@@ -0,0 +1,66 @@
+# user/otp_store.py
+"""
+Email verification OTPs kept in Redis instead of the EmailOtp table.
+
+Each pending verification is two keys sharing the OTP lifetime:
+    otp:<user_id>           the 6-digit code
+    otp:attempts:<user_id>  failed attempts so far
+"""
+import secrets
+
+from django_redis import get_redis_connection
+
+OTP_TTL_SECONDS = 5 * 60
+OTP_MAX_ATTEMPTS = 5
+
+# verify_otp() results
+OTP_MISSING = 0
+OTP_VALID = 1
+OTP_INVALID = 2
+OTP_LOCKED = 3
+
+# Check, count and consume in one atomic round trip.
+VERIFY_OTP_SCRIPT = """
+local code = redis.call('GET', KEYS[1])
+if not code then
+    return 0
+end
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 1
+end
+local attempts = redis.call('INCR', KEYS[2])
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 3
+end
+return 2
+"""
+
+
+def _keys(user_id):
+    return f"otp:{user_id}", f"otp:attempts:{user_id}"
+
+
+def generate_otp():
+    """Return a secure random 6-digit code."""
+    return f"{secrets.randbelow(10 ** 6):06d}"
+
+
+def store_otp(user_id, otp):
+    """Save a fresh OTP for the user, replacing any previous one (one round trip)."""
+    otp_key, attempts_key = _keys(user_id)
+    pipe = get_redis_connection("default").pipeline(transaction=False)
+    pipe.setex(otp_key, OTP_TTL_SECONDS, otp)
+    pipe.setex(attempts_key, OTP_TTL_SECONDS, 0)
+    pipe.execute()
+
+
+def verify_otp(user_id, otp):
+    """
+    Check a submitted OTP. Returns one of the OTP_* status codes.
+    The code is deleted on success or once OTP_MAX_ATTEMPTS is reached.
+    """
+    redis = get_redis_connection("default")
+    script = redis.register_script(VERIFY_OTP_SCRIPT)
+    return int(script(keys=list(_keys(user_id)), args=[otp, OTP_MAX_ATTEMPTS]))
@@ -0,0 +1,45 @@
+# user/reset_token_store.py
+"""
+Password reset tokens kept in Redis instead of the PasswordResetToken table.
+
+    pwreset:<sha256(token)>  ->  user id, expiring with the token
+    pwreset:user:<user id>   ->  key of the user's current token
+
+Keys use the token hash, so a Redis dump can't be replayed as reset links.
+Issuing a new token deletes the previous one, so only the latest link works.
+"""
+import secrets
+
+from django_redis import get_redis_connection
+
+from .models import hash_token
+
+RESET_TOKEN_TTL_SECONDS = 30 * 60
+
+
+def _key(token):
+    return f"pwreset:{hash_token(token)}"
+
+
+def _user_key(user_id):
+    return f"pwreset:user:{user_id}"
+
+
+def issue_reset_token(user_id):
+    """Create a reset token for the user, revoke their previous one, and return the raw value to email."""
+    token = secrets.token_urlsafe(32)
+    key = _key(token)
+    redis = get_redis_connection("default")
+    pipe = redis.pipeline()
+    pipe.set(_user_key(user_id), key, ex=RESET_TOKEN_TTL_SECONDS, get=True)
+    pipe.setex(key, RESET_TOKEN_TTL_SECONDS, user_id)
+    previous_key, _ = pipe.execute()
+    if previous_key:
+        redis.delete(previous_key)
+    return token
+
+
+def consume_reset_token(token):
+    """Atomically read and delete a token. Returns the user id, or None if unknown/expired."""
+    user_id = get_redis_connection("default").getdel(_key(token))
+    return int(user_id) if user_id is not None else None
@@ -1,14 +1,19 @@
 # user/serializers.py
 import logging
 
-from django.contrib.auth import authenticate
+from django.contrib.auth.models import update_last_login
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from donations.models import Donation
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer as BaseTokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
 
 from .models import User
+from .tokens import RedisBlacklistRefreshToken
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +32,13 @@ class TokenRefreshResponseSerializer(serializers.Serializer):
         ref_name = 'TokenRefreshResponse'
 
 
+class CustomTokenRefreshSerializer(BaseTokenRefreshSerializer):
+    token_class = RedisBlacklistRefreshToken
+
+
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RedisBlacklistRefreshToken
+    
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
@@ -54,12 +65,21 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         if not user.is_active:
             raise serializers.ValidationError("Your account has been deactivated. Please contact support.")
         
-        # Step 4: Check password
-        authenticated_user = authenticate(username=email, password=password)
-        if authenticated_user is None:
+        # Step 4: Check password against the row we already fetched
+        if not user.check_password(password):
             raise serializers.ValidationError("Your password is incorrect")
         
-        return super().validate(attrs)
+        # Issue tokens directly; super().validate() would authenticate() again
+        self.user = user
+        refresh = self.get_token(user)
+        
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
+        
+        return {
+            'refresh': str(refresh),
+            'access': str(refresh.access_token),
+        }
 
 
 class LogoutSerializer(serializers.Serializer):
@@ -116,15 +136,24 @@ class UserCreateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         validated_data.pop('confirm_password')
-        password = validated_data.pop('password')
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.is_email_verified = False 
-        user.is_active = True 
-        user.save()
-        return user
-
-class UserUpdateSerializer(serializers.ModelSerializer):
+        # Single INSERT: create_user hashes the password before saving
+        return User.objects.create_user(
+            is_email_verified=False,
+            is_active=True,
+            **validated_data
+        )
+
+
+class UpdateFieldsMixin:
+    """ModelSerializer.update() that only writes the submitted columns."""
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
+
+
+class UserUpdateSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('first_name', 'last_name', 'role', 'is_active')
@@ -155,7 +184,39 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class SelfUserUpdateSerializer(serializers.ModelSerializer):
+class AdminBulkUserUpdateSerializer(serializers.Serializer):
+    """
+    Validates a bulk role/status change.
+    The last-admin check is a single EXISTS over admins outside the selection.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        help_text="IDs of the users to update"
+    )
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, required=False)
+    is_active = serializers.BooleanField(required=False)
+    
+    def validate(self, attrs):
+        if 'role' not in attrs and 'is_active' not in attrs:
+            raise serializers.ValidationError("Provide 'role' and/or 'is_active' to update.")
+        
+        removes_admin = attrs.get('role', 'admin') != 'admin' or attrs.get('is_active') is False
+        if removes_admin:
+            other_active_admins = User.objects.filter(
+                role='admin',
+                is_active=True
+            ).exclude(id__in=attrs['ids']).exists()
+            
+            if not other_active_admins:
+                raise serializers.ValidationError(
+                    "Cannot demote or deactivate every admin user. At least one admin must remain in the system."
+                )
+        
+        return attrs
+
+
+class SelfUserUpdateSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for users updating their own profile.
     Restricted to safe fields only (no role or active status changes).
@@ -165,11 +226,22 @@ class SelfUserUpdateSerializer(serializers.ModelSerializer):
         fields = ('first_name', 'last_name')
 
 
-class UserListSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = User
-        fields = ('id', 'email', 'first_name', 'last_name', 'role', 'is_active', 'is_email_verified', 'date_joined', 'last_login')
-        read_only_fields = ('id', 'date_joined', 'last_login')
+class UserListSerializer(serializers.Serializer):
+    """
+    Read-only user representation for admin listings.
+    Plain Serializer so it can render both User instances and .values() dicts.
+    """
+    FIELDS = ('id', 'email', 'first_name', 'last_name', 'role', 'is_active', 'is_email_verified', 'date_joined', 'last_login')
+
+    id = serializers.IntegerField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, read_only=True)
+    is_active = serializers.BooleanField(read_only=True)
+    is_email_verified = serializers.BooleanField(read_only=True)
+    date_joined = serializers.DateTimeField(read_only=True)
+    last_login = serializers.DateTimeField(read_only=True)
 
 
 class AdminPasswordResetSerializer(serializers.Serializer):
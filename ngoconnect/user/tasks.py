@@ -0,0 +1,69 @@
+# user/tasks.py
+from celery import shared_task
+from django.core.mail import get_connection
+
+from .email_service import EmailService
+from .models import EmailOtp, EmailVerificationToken, PasswordResetToken
+
+# EmailService.send_* log and swallow SMTP errors and return False, so the
+# email tasks retry on a False result rather than on an exception.
+EMAIL_TASK_OPTIONS = {
+    'bind': True,
+    'max_retries': 3,
+    'default_retry_delay': 30,
+    'ignore_result': True,
+}
+
+
+def send_to_each_recipient(task, recipient_emails, send, retry_args):
+    """
+    Call send(recipient_email, connection) for every recipient over one SMTP
+    connection. If any send returns False, retry the task with retry_args
+    followed by the recipients that failed, so the others aren't emailed twice.
+    """
+    if not recipient_emails:
+        return
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:
+        raise task.retry(exc=exc)
+
+    failed = []
+    try:
+        for recipient_email in recipient_emails:
+            if not send(recipient_email, connection):
+                failed.append(recipient_email)
+    finally:
+        connection.close()
+
+    if failed:
+        raise task.retry(args=(*retry_args, failed), kwargs={})
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_otp_email_task(self, email, otp):
+    if not EmailService.send_otp_email(email, otp):
+        raise self.retry()
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_welcome_email_task(self, email, first_name):
+    if not EmailService.send_welcome_email(email, first_name):
+        raise self.retry()
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_password_reset_email_task(self, email, reset_token):
+    if not EmailService.send_password_reset_email(email, reset_token):
+        raise self.retry()
+
+
+@shared_task(ignore_result=True)
+def cleanup_expired_tokens():
+    """Purge expired verification tokens, reset tokens and OTPs."""
+    return {
+        model.__name__: model.cleanup_expired()
+        for model in (EmailVerificationToken, PasswordResetToken, EmailOtp)
+    }
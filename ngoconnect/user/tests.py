@@ -0,0 +1,192 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from donations.models import Donation
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .cache import get_admin_emails
+from .models import User
+from .otp_store import store_otp
+
+TEST_PASSWORD = 'Str0ng!pass9'  # nosec
+
+
+class AdminBulkUserUpdateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password=TEST_PASSWORD, role='admin', is_active=True
+        )
+        self.member = User.objects.create_user(
+            email='member@example.com', password=TEST_PASSWORD, first_name='Old', is_active=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def bulk_update(self, body):
+        return self.client.patch(reverse('admin_user_bulk_update'), body, format='json')
+
+    def test_bulk_update_invalidates_list(self):
+        self.client.get(reverse('admin_user_list'))
+        response = self.bulk_update({'ids': [self.member.pk], 'is_active': False})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'updated': 1})
+        rows = {row['email']: row for row in self.client.get(reverse('admin_user_list')).data['results']}
+        self.assertFalse(rows['member@example.com']['is_active'])
+
+    def test_bulk_role_change_refreshes_admin_recipients(self):
+        self.assertEqual(get_admin_emails(), ['admin@example.com'])
+        response = self.bulk_update({'ids': [self.member.pk], 'role': 'manager'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.member.refresh_from_db()
+        self.assertEqual(self.member.role, 'manager')
+        # update() fires no signals, so the view drops the cached list itself
+        self.assertCountEqual(get_admin_emails(), ['admin@example.com', 'member@example.com'])
+
+
+class VerifyEmailOtpTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='otp@example.com', password=TEST_PASSWORD, is_active=True, is_email_verified=False
+        )
+
+    def verify(self, otp):
+        return self.client.post(reverse('verify_email'), {'email': self.user.email, 'otp': otp}, format='json')
+
+    def test_valid_otp_verifies_user(self):
+        store_otp(self.user.id, '123456')
+        response = self.verify('123456')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_email_verified)
+        # Single use
+        self.assertEqual(self.verify('123456').status_code, status.HTTP_200_OK)
+        self.assertEqual(self.verify('123456').data['message'], 'Email already verified')
+
+    def test_wrong_otp_is_rejected(self):
+        store_otp(self.user.id, '123456')
+        response = self.verify('654321')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Invalid OTP')
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_email_verified)
+
+    def test_expired_otp_is_rejected(self):
+        with mock.patch('user.otp_store.OTP_TTL_SECONDS', 1):
+            store_otp(self.user.id, '123456')
+        time.sleep(1.2)
+        response = self.verify('123456')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('expired', response.data['error'])
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_email_verified)
+
+
+class AdminUserListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password=TEST_PASSWORD, role='admin', is_active=True
+        )
+        self.member = User.objects.create_user(
+            email='member@example.com', password=TEST_PASSWORD, first_name='Old', is_active=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def first_names(self):
+        response = self.client.get(reverse('admin_user_list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {row['email']: row['first_name'] for row in response.data['results']}
+
+    def test_list_is_cached_until_an_admin_edit(self):
+        self.assertEqual(self.first_names()['member@example.com'], 'Old')
+
+        # Served from the cache: a write that skips invalidation isn't visible yet
+        User.objects.filter(pk=self.member.pk).update(first_name='Sneaky')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.first_names()['member@example.com'], 'Old')
+
+        response = self.client.patch(
+            reverse('admin_user_detail', args=[self.member.pk]), {'first_name': 'New'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.first_names()['member@example.com'], 'New')
+
+
+class LogoutTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        User.objects.create_user(
+            email='logout@example.com', password=TEST_PASSWORD, is_active=True, is_email_verified=True
+        )
+        response = self.client.post(
+            reverse('token_obtain_pair'),
+            {'email': 'logout@example.com', 'password': TEST_PASSWORD},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.access = response.data['access']
+        self.refresh = response.data['refresh']
+
+    def test_logout_revokes_access_and_refresh_tokens(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access}')
+        self.assertEqual(self.client.get(reverse('profile')).status_code, status.HTTP_200_OK)
+
+        response = self.client.post(reverse('logout'), {'refresh': self.refresh}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.client.get(reverse('profile')).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = APIClient().post(reverse('token_refresh'), {'refresh': self.refresh}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        client = APIClient()
+        response = client.post(reverse('token_refresh'), {'refresh': self.refresh}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = client.post(reverse('token_refresh'), {'refresh': self.refresh}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class DonationHistoryPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='donor@example.com', password=TEST_PASSWORD, is_active=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for i in range(120):
+            Donation.objects.create(
+                donor=self.user, amount='10.00', transaction_id=f'history-{i}', status='SUCCESS'
+            )
+        # 60 donations on one timestamp, so a page boundary falls inside the group
+        same_time = timezone.now() - timedelta(hours=1)
+        ids = Donation.objects.order_by('id').values_list('id', flat=True)[30:90]
+        Donation.objects.filter(id__in=list(ids)).update(timestamp=same_time)
+
+    def test_pages_return_every_donation_once_newest_first(self):
+        seen, cursor = [], None
+        while True:
+            params = {'before': cursor} if cursor else {}
+            response = self.client.get(reverse('user_donations'), params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend((row['timestamp'], row['id']) for row in response.data['data'])
+            cursor = response.data['next']
+            if not cursor:
+                break
+        self.assertEqual(len(seen), 120)
+        self.assertEqual(len(set(seen)), 120)
+        self.assertEqual(seen, sorted(seen, reverse=True))
+
+    def test_invalid_cursor_is_rejected(self):
+        for cursor in ('junk', '2026-13-45T00:00:00Z,5', '2026-01-01T00:00:00Z,x'):
+            response = self.client.get(reverse('user_donations'), {'before': cursor})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
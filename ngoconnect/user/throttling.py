@@ -0,0 +1,16 @@
+# user/throttling.py
+from django_redis import get_redis_connection
+from rest_framework.throttling import BaseThrottle
+
+
+def throttle(key, ttl):
+    """
+    Allow one hit per `key` every `ttl` seconds.
+    Returns False if the key was already hit inside the window (atomic SET NX EX).
+    """
+    return bool(get_redis_connection("default").set(key, 1, nx=True, ex=ttl))
+
+
+def client_ip(request):
+    """Client address as DRF throttles see it (honours NUM_PROXIES / X-Forwarded-For)."""
+    return BaseThrottle().get_ident(request)
@@ -0,0 +1,50 @@
+# user/tokens.py
+"""
+JWT revocation kept in Redis instead of the token_blacklist tables.
+
+    jti:blacklist:<jti>  ->  1, expiring when the token itself would
+
+Both refresh tokens (logout, rotation) and access tokens (logout) are revoked
+by jti, so no OutstandingToken/BlacklistedToken rows are written or queried.
+"""
+import time
+
+from django_redis import get_redis_connection
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+
+
+def _key(jti):
+    return f"jti:blacklist:{jti}"
+
+
+def blacklist_jti(jti, exp):
+    """Revoke a token id until its `exp` timestamp. Already-expired tokens are skipped."""
+    ttl = int(exp - time.time())
+    if ttl > 0:
+        get_redis_connection("default").setex(_key(jti), ttl, 1)
+
+
+def is_jti_blacklisted(jti):
+    return bool(get_redis_connection("default").exists(_key(jti)))
+
+
+class RedisBlacklistRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist lives in Redis."""
+
+    @classmethod
+    def for_user(cls, user):
+        # Skip BlacklistMixin.for_user, which inserts an OutstandingToken row
+        return super(BlacklistMixin, cls).for_user(user)
+
+    def check_blacklist(self):
+        if is_jti_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self):
+        blacklist_jti(self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
+
+    def outstand(self):
+        # Nothing to record: only revoked tokens are tracked
+        return None
@@ -2,11 +2,11 @@ from django.urls import path
 
 from .dashboard_views import DashboardSummaryView
 from .views import (
-    AdminResetPasswordView, AdminUserDetailView, AdminUserListView,
-    ChangePasswordView, CustomTokenObtainPairView, ForgotPasswordView,
-    LogoutView, ProfileView, RegistrationView, ResendOtpView,
-    ResetPasswordView, TokenRefreshView, UserDonationHistoryView,
-    VerifyEmailView,
+    AdminBulkUserUpdateView, AdminResetPasswordView, AdminUserDetailView,
+    AdminUserListView, ChangePasswordView, CustomTokenObtainPairView,
+    ForgotPasswordView, LogoutView, ProfileView, RegistrationView,
+    ResendOtpView, ResetPasswordView, TokenRefreshView,
+    UserDonationHistoryView, VerifyEmailView,
 )
 
 urlpatterns = [
@@ -26,6 +26,7 @@ urlpatterns = [
     
     # Admin User Management
     path('admin/users/', AdminUserListView.as_view(), name='admin_user_list'),
+    path('admin/users/bulk-update/', AdminBulkUserUpdateView.as_view(), name='admin_user_bulk_update'),
     path('admin/users/<int:user_id>/', AdminUserDetailView.as_view(), name='admin_user_detail'),
     path('admin/users/<int:user_id>/reset-password/', AdminResetPasswordView.as_view(), name='admin_reset_password'),
     path('verify-email/', VerifyEmailView.as_view(), name='verify_email'),
@@ -1,33 +1,57 @@
 # user/views.py
 import structlog
+from core.pagination import IdCursorPagination
 from core.permissions import IsBusinessAdmin
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
 from donations.models import Donation
 from donations.serializers import DonationPublicSerializer
 from drf_spectacular.openapi import OpenApiResponse
-from drf_spectacular.utils import OpenApiExample, extend_schema
-from rest_framework import status
+from drf_spectacular.utils import (
+    OpenApiExample, OpenApiParameter, extend_schema, inline_serializer,
+)
+from rest_framework import serializers, status
+from rest_framework.generics import ListAPIView
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.views import (
     TokenObtainPairView, TokenRefreshView as BaseTokenRefreshView,
 )
 
-from .email_service import EmailService
-from .models import EmailOtp, EmailVerificationToken, PasswordResetToken, User
+from .cache import (
+    USER_LIST_CACHE_TTL, invalidate_admin_emails, invalidate_user_list,
+    user_list_cache_key,
+)
+from .models import EmailVerificationToken, User
+from .otp_store import (
+    OTP_INVALID, OTP_LOCKED, OTP_MISSING, generate_otp, store_otp, verify_otp,
+)
+from .reset_token_store import consume_reset_token, issue_reset_token
 from .serializers import (
-    AdminPasswordResetSerializer, ChangePasswordSerializer,
-    CustomTokenObtainPairSerializer, DonationHistorySerializer,
+    AdminBulkUserUpdateSerializer, AdminPasswordResetSerializer,
+    ChangePasswordSerializer, CustomTokenObtainPairSerializer,
+    CustomTokenRefreshSerializer, DonationHistorySerializer,
     ForgotPasswordSerializer, LogoutSerializer, ResendOtpSerializer,
     ResetPasswordSerializer, SelfUserUpdateSerializer,
     TokenRefreshResponseSerializer, TokenRefreshSerializer,
     UserCreateSerializer, UserListSerializer, UserProfileSerializer,
     UserUpdateSerializer, VerifyEmailSerializer,
 )
+from .tasks import (
+    send_otp_email_task, send_password_reset_email_task,
+    send_welcome_email_task,
+)
+from .throttling import client_ip, throttle
+from .tokens import RedisBlacklistRefreshToken, blacklist_jti
+
+DONATION_STATUS_LABELS = dict(Donation.STATUS_CHOICES)
 
 logger = structlog.get_logger("api.business")
 security_logger = structlog.get_logger("api.security")
@@ -39,6 +63,8 @@ class CustomTokenObtainPairView(TokenObtainPairView):
 
 
 class TokenRefreshView(BaseTokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
+    
     @extend_schema(
         request=TokenRefreshSerializer,
         responses={200: TokenRefreshResponseSerializer},
@@ -75,7 +101,7 @@ class RegistrationView(APIView):
                 ]
             ),
             400: OpenApiResponse(description="Validation errors or User already exists"),
-            500: OpenApiResponse(description="Email sending failed")
+            500: OpenApiResponse(description="User could not be created")
         }
     )
     def post(self, request):
@@ -86,28 +112,32 @@ class RegistrationView(APIView):
             if existing_user and not existing_user.is_email_verified:
                 # Delete the unverified user to allow re-registration with fresh data
                 existing_user.delete()
+                invalidate_user_list()
 
         serializer = UserCreateSerializer(data=request.data)
         if serializer.is_valid():
             try:
+                # 1. Create User (Active=False until verified)
                 with transaction.atomic():
-                    # 1. Create User (Active=False until verified)
                     user = serializer.save()
-                    
-                    # 2. Generate OTP
-                    otp_instance = EmailOtp.objects.create(user=user)
-                    
-                    # 3. Send Email
-                    if EmailService.send_otp_email(user.email, otp_instance.otp):
-                        return Response({
-                            'message': 'Registration successful. Please check your email for the OTP.',
-                            'email': user.email
-                        }, status=status.HTTP_201_CREATED)
-                    else:
-                        return Response({
-                            'message': 'User registered, but failed to send email. Please use the Resend OTP endpoint.',
-                            'email': user.email
-                        }, status=status.HTTP_201_CREATED)
+                
+                # 2. Generate OTP
+                otp = generate_otp()
+                store_otp(user.id, otp)
+                
+                # 3. Queue the email once the user row is committed. The user and
+                # OTP already exist, so a broker failure must not turn this into a
+                # 500; the user can ask for the code again via resend-otp.
+                transaction.on_commit(
+                    lambda: send_otp_email_task.delay(user.email, otp),
+                    robust=True
+                )
+                
+                invalidate_user_list()
+                return Response({
+                    'message': 'Registration successful. Please check your email for the OTP.',
+                    'email': user.email
+                }, status=status.HTTP_201_CREATED)
                         
             except Exception as e:
                 return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -150,40 +180,34 @@ class VerifyEmailView(APIView):
         otp_code = serializer.validated_data['otp']
 
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.only('id', 'email', 'first_name', 'is_active', 'is_email_verified').get(email=email)
         except User.DoesNotExist:
             return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
 
         if user.is_email_verified:
             return Response({'message': 'Email already verified'}, status=status.HTTP_200_OK)
 
-        # Get latest OTP
-        try:
-            otp_record = EmailOtp.objects.filter(user=user).latest('created_at')
-        except EmailOtp.DoesNotExist:
-            return Response({'error': 'No OTP found. Please request a new one.'}, status=status.HTTP_400_BAD_REQUEST)
-
-        # OTP Validation
-        if otp_record.otp != otp_code:
-            otp_record.attempts += 1
-            otp_record.save()
-            return Response({'error': 'Invalid OTP'}, status=status.HTTP_400_BAD_REQUEST)
+        # OTP Validation (expired codes are gone from Redis)
+        otp_status = verify_otp(user.id, otp_code)
+        if otp_status == OTP_MISSING:
+            return Response({'error': 'OTP has expired or was not found. Please request a new one.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        if otp_record.is_expired():
-            return Response({'error': 'OTP has expired'}, status=status.HTTP_400_BAD_REQUEST)
+        if otp_status == OTP_INVALID:
+            return Response({'error': 'Invalid OTP'}, status=status.HTTP_400_BAD_REQUEST)
 
-        if otp_record.attempts >= 5:
+        if otp_status == OTP_LOCKED:
             return Response({'error': 'Too many failed attempts. Request a new OTP.'}, status=status.HTTP_400_BAD_REQUEST)
 
         # Success Logic
         user.is_active = True
         user.is_email_verified = True
-        user.save()
-        EmailOtp.objects.filter(user=user).delete()
-        try:
-            EmailService.send_welcome_email(user.email, user.first_name)
-        except:
-            pass #nosec
+        user.save(update_fields=['is_active', 'is_email_verified'])
+        invalidate_user_list()
+        # Optional email: a broker failure must not fail verification
+        transaction.on_commit(
+            lambda: send_welcome_email_task.delay(user.email, user.first_name),
+            robust=True
+        )
 
         return Response({'message': 'Email verified successfully! You can now login.'}, status=status.HTTP_200_OK)
 
@@ -210,7 +234,8 @@ class ResendOtpView(APIView):
                     )
                 ]
             ),
-            404: OpenApiResponse(description="User not found")
+            404: OpenApiResponse(description="User not found"),
+            429: OpenApiResponse(description="OTP requested too recently for this email or IP")
         }
     )
     def post(self, request):
@@ -220,19 +245,24 @@ class ResendOtpView(APIView):
 
         email = serializer.validated_data['email']
         
+        if not throttle(f"otp:ip:{client_ip(request)}", 60) or not throttle(f"otp:email:{email}", 60):
+            return Response({'error': 'Please wait before requesting again'}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+        
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.only('id', 'email', 'is_email_verified').get(email=email)
             if user.is_email_verified:
                 return Response({'message': 'User is already verified'}, status=status.HTTP_200_OK)
             
             # Generate New OTP
-            otp_instance = EmailOtp.objects.create(user=user)
+            otp = generate_otp()
+            store_otp(user.id, otp)
             
-            # Send Email
-            if EmailService.send_otp_email(user.email, otp_instance.otp):
-                return Response({'message': 'New OTP sent successfully'}, status=status.HTTP_200_OK)
-            else:
-                return Response({'error': 'Failed to send email. Try again later.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            # Queue Email (a broker failure is logged, not turned into a 500)
+            transaction.on_commit(
+                lambda: send_otp_email_task.delay(user.email, otp),
+                robust=True
+            )
+            return Response({'message': 'New OTP sent successfully'}, status=status.HTTP_200_OK)
                 
         except User.DoesNotExist:
             return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -301,23 +331,69 @@ class ChangePasswordView(APIView):
                 return Response({'error': 'Invalid old password'}, status=status.HTTP_400_BAD_REQUEST)
             
             request.user.set_password(serializer.validated_data['new_password'])
-            request.user.save()
+            request.user.save(update_fields=['password'])
             return Response({'message': 'Password changed successfully'}, status=status.HTTP_200_OK)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class UserDonationHistoryView(APIView):
     permission_classes = [IsAuthenticated]
+    page_size = 50
     
     @extend_schema(
         summary="My Donation History",
-        description="List all donations made by the logged-in user.",
-        responses={200: DonationHistorySerializer(many=True)}
+        description=(
+            "List donations made by the logged-in user, newest first, 50 per page. "
+            "Pass the returned `next` cursor as `before` to fetch the following page."
+        ),
+        parameters=[
+            OpenApiParameter(name='before', description='Only donations after this cursor in the listing (the previous page\'s `next`)', required=False, type=str),
+        ],
+        responses={
+            200: inline_serializer(
+                name='DonationHistoryPage',
+                fields={
+                    'data': DonationHistorySerializer(many=True),
+                    'next': serializers.CharField(allow_null=True),
+                }
+            ),
+            400: OpenApiResponse(description="Invalid before cursor")
+        }
     )
     def get(self, request):
-        donations = Donation.objects.filter(donor=request.user).order_by('-timestamp')
-        serializer = DonationHistorySerializer(donations, many=True)
-        return Response(serializer.data)
+        donations = Donation.objects.filter(donor=request.user)
+        
+        # Keyset pagination on the (donor, -timestamp, -id) index. The cursor is
+        # "<timestamp>,<id>" of the last row, so rows sharing a timestamp aren't skipped
+        before = request.query_params.get('before')
+        if before:
+            before_ts, _, before_id = before.rpartition(',')
+            try:
+                before_dt = parse_datetime(before_ts)
+            except ValueError:
+                before_dt = None
+            if before_dt is None or not before_id.isdigit():
+                return Response({'error': 'Invalid before cursor'}, status=status.HTTP_400_BAD_REQUEST)
+            donations = donations.filter(
+                Q(timestamp__lt=before_dt) | Q(timestamp=before_dt, id__lt=int(before_id))
+            )
+        
+        # Plain rows in DonationHistorySerializer's shape
+        rows = list(
+            donations.order_by('-timestamp', '-id').values(
+                'id', 'amount', 'transaction_id', 'status', 'timestamp', 'receipt_sent',
+                campaign_title=F('campaign__title'),
+            )[:self.page_size]
+        )
+        for row in rows:
+            row['amount'] = str(row['amount'])
+            row['status_display'] = DONATION_STATUS_LABELS[row['status']]
+        
+        next_cursor = None
+        if len(rows) == self.page_size:
+            last = rows[-1]
+            next_cursor = f"{last['timestamp'].strftime('%Y-%m-%dT%H:%M:%S.%fZ')},{last['id']}"
+        return Response({'data': rows, 'next': next_cursor})
 
 
 
@@ -326,7 +402,7 @@ class LogoutView(APIView):
     
     @extend_schema(
         summary="Logout user",
-        description="Logout user by blacklisting refresh token",
+        description="Logout user by blacklisting the refresh token and the current access token",
         request=LogoutSerializer,
         responses={
             200: OpenApiResponse(description="Logout successful"),
@@ -343,8 +419,11 @@ class LogoutView(APIView):
         
         try:
             refresh_token = serializer.validated_data['refresh']
-            token = RefreshToken(refresh_token)
+            token = RedisBlacklistRefreshToken(refresh_token)
             token.blacklist()
+            # Revoke the access token used for this request as well
+            if request.auth is not None:
+                blacklist_jti(request.auth[api_settings.JTI_CLAIM], request.auth['exp'])
             
             logger.info(f"User {user_email} logged out successfully")
             return Response({'message': 'Logout successful'}, status=status.HTTP_200_OK)
@@ -375,7 +454,8 @@ class ForgotPasswordView(APIView):
         request=ForgotPasswordSerializer,
         responses={
             200: OpenApiResponse(description="Password reset email sent"),
-            400: OpenApiResponse(description="Validation errors")
+            400: OpenApiResponse(description="Validation errors"),
+            429: OpenApiResponse(description="Reset requested too recently for this email or IP")
         }
     )
     def post(self, request):
@@ -388,22 +468,22 @@ class ForgotPasswordView(APIView):
         email = serializer.validated_data['email']
         security_logger.info(f"Password reset requested for email: {email}")
         
+        if not throttle(f"pwreset:ip:{client_ip(request)}", 60) or not throttle(f"pwreset:email:{email}", 60):
+            security_logger.warning(f"Password reset throttled for email: {email}")
+            return Response({'error': 'Please wait before requesting again'}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+        
         try:
-            user = User.objects.get(email=email)
-            
-            # Invalidate existing tokens
-            PasswordResetToken.objects.filter(user=user, is_used=False).update(is_used=True)
-            
-            # Create new token
-            reset_token = PasswordResetToken.objects.create(user=user)
+            user = User.objects.only('id').get(email=email)
             
-            # Send email
-            email_sent = EmailService.send_password_reset_email(email, reset_token.token)
+            # Create new token (expires on its own in Redis)
+            reset_token = issue_reset_token(user.id)
             
-            if email_sent:
-                security_logger.info(f"Password reset email sent successfully to {email}")
-            else:
-                security_logger.error(f"Failed to send password reset email to {email}")
+            # Queue email (a broker failure is logged, not turned into a 500)
+            transaction.on_commit(
+                lambda: send_password_reset_email_task.delay(email, reset_token),
+                robust=True
+            )
+            security_logger.info(f"Password reset email queued for {email}")
                 
         except User.DoesNotExist:
             security_logger.warning(f"Password reset requested for non-existent email: {email}")
@@ -435,44 +515,51 @@ class ResetPasswordView(APIView):
         email = serializer.validated_data['email']
         new_password = serializer.validated_data['new_password']
         
+        # Single use: the token is deleted as it is read
+        user_id = consume_reset_token(token)
+        if user_id is None:
+            security_logger.warning(f"Password reset failed for {email} - expired or invalid token")
+            return Response(
+                {'error': 'Token is expired or invalid'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         try:
-            user = User.objects.get(email=email)
-            reset_token = PasswordResetToken.objects.get(token=token, user=user)
-            
-            if not reset_token.is_valid:
-                security_logger.warning(f"Password reset failed for {email} - expired or invalid token")
-                return Response(
-                    {'error': 'Token is expired or invalid'}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            user.set_password(new_password)
-            user.save()
-            
-            reset_token.is_used = True
-            reset_token.save()
-            
-            security_logger.info(f"Password reset completed successfully for user {email}")
-            return Response({'message': 'Password reset successfully'}, status=status.HTTP_200_OK)
-            
-        except (User.DoesNotExist, PasswordResetToken.DoesNotExist):
+            user = User.objects.get(id=user_id, email=email)
+        except User.DoesNotExist:
             security_logger.warning(f"Password reset failed for {email} - invalid token or email")
             return Response({'error': 'Invalid token or email'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        user.set_password(new_password)
+        user.save(update_fields=['password'])
+        
+        security_logger.info(f"Password reset completed successfully for user {email}")
+        return Response({'message': 'Password reset successfully'}, status=status.HTTP_200_OK)
 
 
 # Admin Views
-class AdminUserListView(APIView):
+class AdminUserListView(ListAPIView):
     permission_classes = [IsAuthenticated, IsBusinessAdmin]
+    pagination_class = IdCursorPagination
+    serializer_class = UserListSerializer
+    queryset = User.objects.values(*UserListSerializer.FIELDS)
     
     @extend_schema(
         summary="List all users (Admin only)",
-        description="Get list of all users in the system",
-        responses={200: UserListSerializer(many=True)}
+        description="Get a cursor-paginated list of all users in the system, ordered by id"
     )
-    def get(self, request):
-        users = User.objects.all().order_by('first_name', 'last_name')
-        serializer = UserListSerializer(users, many=True)
-        return Response(serializer.data)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+    
+    def list(self, request, *args, **kwargs):
+        key = user_list_cache_key(request.query_params.get(self.paginator.cursor_query_param))
+        data = cache.get(key)
+        if data is None:
+            # values() rows already have UserListSerializer's shape; skip per-row serialization
+            page = self.paginate_queryset(self.get_queryset())
+            data = self.get_paginated_response(page).data
+            cache.set(key, data, USER_LIST_CACHE_TTL)
+        return Response(data)
 
 
 class AdminUserDetailView(APIView):
@@ -511,6 +598,7 @@ class AdminUserDetailView(APIView):
         serializer = UserUpdateSerializer(user, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            invalidate_user_list()
             return Response(UserListSerializer(user).data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
@@ -530,10 +618,47 @@ class AdminUserDetailView(APIView):
         
         user_email = user.email
         user.delete()
+        invalidate_user_list()
         
         return Response({'message': f'User {user_email} deleted successfully'}, status=status.HTTP_200_OK)
 
 
+class AdminBulkUserUpdateView(APIView):
+    """Admin: change role and/or active status for many users in one UPDATE."""
+    permission_classes = [IsAuthenticated, IsBusinessAdmin]
+    # JSON only: form parsing would turn a missing is_active into False
+    parser_classes = [JSONParser]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'post_apis'
+    
+    @extend_schema(
+        summary="Bulk update users (Admin only)",
+        description="Set role and/or is_active on a list of users. Signals are not fired.",
+        request=AdminBulkUserUpdateSerializer,
+        responses={
+            200: OpenApiResponse(
+                description="Users updated",
+                examples=[OpenApiExample('Success', value={'updated': 3})]
+            ),
+            400: OpenApiResponse(description="Validation errors or last admin would be removed")
+        }
+    )
+    def patch(self, request):
+        serializer = AdminBulkUserUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        data = serializer.validated_data
+        changes = {field: data[field] for field in ('role', 'is_active') if field in data}
+        updated = User.objects.filter(id__in=data['ids']).update(**changes)
+        invalidate_user_list()
+        # queryset.update() skips the signal that refreshes this list
+        invalidate_admin_emails()
+        
+        audit_logger.info(f"Bulk user update by {request.user.email}: {changes} applied to {updated} users")
+        return Response({'updated': updated}, status=status.HTTP_200_OK)
+
+
 class AdminResetPasswordView(APIView):
     permission_classes = [IsAuthenticated, IsBusinessAdmin]
     throttle_classes = [ScopedRateThrottle]
@@ -557,7 +682,7 @@ class AdminResetPasswordView(APIView):
         serializer = AdminPasswordResetSerializer(data=request.data, context={'user': user})
         if serializer.is_valid():
             user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            user.save(update_fields=['password'])
             return Response({'message': 'Password reset successfully'})
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
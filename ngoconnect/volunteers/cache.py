@@ -0,0 +1,16 @@
+# volunteers/cache.py
+"""Redis caches for the volunteer workflow."""
+from core.cache import bump_generation, get_generation
+
+VOLUNTEER_LIST_CACHE_TTL = 60
+VOLUNTEER_LIST_GENERATION_KEY = 'vol:list:gen'
+
+
+def volunteer_list_cache_key(status_filter, page):
+    """One entry per status filter and page of the admin volunteer list."""
+    generation = get_generation(VOLUNTEER_LIST_GENERATION_KEY)
+    return f"vol:list:{generation}:{status_filter.upper() if status_filter else 'all'}:{page or 1}"
+
+
+def invalidate_volunteer_list():
+    bump_generation(VOLUNTEER_LIST_GENERATION_KEY)
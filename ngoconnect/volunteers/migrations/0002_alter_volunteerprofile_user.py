@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('volunteers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='volunteerprofile',
+            name='user',
+            field=models.OneToOneField(limit_choices_to={'role': 'volunteer'}, on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='volunteer_profile', serialize=False, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
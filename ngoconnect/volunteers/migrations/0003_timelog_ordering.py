@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('volunteers', '0002_alter_volunteerprofile_user'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='timelog',
+            options={'ordering': ['-start_time'], 'verbose_name': 'Volunteer Time Log', 'verbose_name_plural': 'Volunteer Time Logs'},
+        ),
+    ]
@@ -13,7 +13,7 @@ class VolunteerProfile(models.Model):
     )
 
     user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, 
-                                limit_choices_to={'role': 'volunteer'})
+                                limit_choices_to={'role': 'volunteer'}, related_name='volunteer_profile')
     skills = models.TextField(blank=True, help_text="List skills, e.g., 'Python, Marketing, Design'")
     availability = models.CharField(max_length=100, blank=True)
     application_status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
@@ -42,13 +42,14 @@ class TimeLog(models.Model):
 
     def save(self, *args, **kwargs):
         if self.start_time and self.end_time:
-            duration: timedelta = self.end_time - self.start_time
-            self.duration_minutes = int(duration.total_seconds() / 60)
+            # Whole minutes via integer timedelta division (no float round-trip)
+            self.duration_minutes = (self.end_time - self.start_time) // timedelta(minutes=1)
         super().save(*args, **kwargs)
 
     class Meta:
         verbose_name = "Volunteer Time Log"
         verbose_name_plural = "Volunteer Time Logs"
+        ordering = ['-start_time']
         indexes = [
             models.Index(fields=['volunteer', 'start_time']),
         ]
@@ -1,5 +1,9 @@
 # volunteer/serializers.py
+from collections.abc import Mapping
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 from .models import TimeLog, VolunteerProfile
 
@@ -17,9 +21,6 @@ class VolunteerApplySerializer(serializers.ModelSerializer):
         # Prevent Admin/Managers from applying as volunteers (downgrading role)
         if user.role in ['admin', 'manager']:
             raise serializers.ValidationError("Admins and Managers cannot apply as volunteers.")
-
-        if VolunteerProfile.objects.filter(user=user).exists():
-            raise serializers.ValidationError("You have already applied as a volunteer.")
         return attrs
     
     def create(self, validated_data):
@@ -30,7 +31,14 @@ class VolunteerApplySerializer(serializers.ModelSerializer):
         # User remains 'general_user' until approved? 
         # Requirement says: "Admin shall review and approve/reject".
         
-        return VolunteerProfile.objects.create(user=user, **validated_data)
+        # The one-to-one primary key rejects a second application; no exists() pre-check
+        try:
+            with transaction.atomic():
+                return VolunteerProfile.objects.create(user=user, **validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: ["You have already applied as a volunteer."]
+            })
 
 
 class VolunteerProfileSerializer(serializers.ModelSerializer):
@@ -71,10 +79,54 @@ class VolunteerAdminSerializer(serializers.ModelSerializer):
         )
 
 
+def dump_volunteer_admin(volunteers):
+    """
+    Straight-line equivalent of VolunteerAdminSerializer(volunteers, many=True).data
+    for list endpoints: skips DRF's per-field dispatch. Keep the keys in sync.
+    """
+    return [
+        {
+            'user_id': v.user_id,
+            'email': v.user.email,
+            'first_name': v.user.first_name,
+            'last_name': v.user.last_name,
+            'skills': v.skills,
+            'availability': v.availability,
+            'application_status': v.application_status,
+        }
+        for v in volunteers
+    ]
+
+
+REVIEW_STATUSES = ('APPROVED', 'REJECTED')
+
 
 class VolunteerReviewSerializer(serializers.Serializer):
     """For admin approving/rejecting volunteers."""
-    application_status = serializers.ChoiceField(choices=['APPROVED', 'REJECTED'])
+    application_status = serializers.ChoiceField(choices=REVIEW_STATUSES)
+
+
+def validate_review_status(data):
+    """
+    Same checks and error bodies as VolunteerReviewSerializer(data=data).is_valid(),
+    without building a serializer. Returns (application_status, errors).
+    """
+    if not isinstance(data, Mapping):
+        message = serializers.Serializer.default_error_messages['invalid']
+        return None, {
+            api_settings.NON_FIELD_ERRORS_KEY: [message.format(datatype=type(data).__name__)]
+        }
+    if 'application_status' not in data:
+        message = serializers.Field.default_error_messages['required']
+    elif data['application_status'] is None:
+        message = serializers.Field.default_error_messages['null']
+    elif data['application_status'] in REVIEW_STATUSES:
+        return data['application_status'], None
+    else:
+        message = serializers.ChoiceField.default_error_messages['invalid_choice'].format(
+            input=data['application_status']
+        )
+    return None, {'application_status': [message]}
 
 
 # --- Time Log Serializers ---
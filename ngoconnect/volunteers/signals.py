@@ -1,36 +1,76 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from user.cache import (
+    ADMIN_ROLES, invalidate_admin_emails, invalidate_user_list,
+)
 from user.models import User
 
+from .cache import invalidate_volunteer_list
 from .models import VolunteerProfile
 
+# User fields that decide who is on the admin recipient list
+ADMIN_EMAIL_FIELDS = {'role', 'is_active', 'email'}
+# User fields shown in the admin volunteer list
+VOLUNTEER_LIST_USER_FIELDS = {'email', 'first_name', 'last_name'}
+
 
 @receiver(post_save, sender=User)
-def sync_volunteer_profile_status(sender, instance, created, **kwargs):
+def sync_volunteer_profile_status(sender, instance, created, update_fields=None, **kwargs):
     """
     If a User's role is set to 'volunteer' (e.g. via Admin Panel),
     automatically auto-approve their pending volunteer profile.
     """
+    if update_fields is not None and 'role' not in update_fields:
+        return
     if instance.role == 'volunteer':
-        try:
-            profile = VolunteerProfile.objects.get(user=instance)
-            if profile.application_status != 'APPROVED':
-                profile.application_status = 'APPROVED'
-                # Disable signals temporarily to avoid recursion if needed? 
-                # Actually, simply checking the value prevents infinite loops.
-                profile.save()
-        except VolunteerProfile.DoesNotExist:
-            pass
+        profile = VolunteerProfile.objects.filter(user=instance).exclude(application_status='APPROVED').first()
+        if profile is not None:
+            profile.application_status = 'APPROVED'
+            # Saved (not queryset-updated) so the approval notification still fires
+            profile.save(update_fields=['application_status'])
+
 
 @receiver(post_save, sender=VolunteerProfile)
-def sync_user_role(sender, instance, created, **kwargs):
+def sync_user_role(sender, instance, created, update_fields=None, **kwargs):
     """
     If a VolunteerProfile is APPROVED (e.g. via Admin Panel),
     automatically update the User's role to 'volunteer'.
     """
+    if update_fields is not None and 'application_status' not in update_fields:
+        return
     if instance.application_status == 'APPROVED':
-        user = instance.user
-        # Don't downgrade Admins/Managers to Volunteers automatically
-        if user.role not in ['admin', 'manager', 'volunteer']:
-            user.role = 'volunteer'
-            user.save()
+        # Single UPDATE, no User signals. Don't downgrade Admins/Managers to Volunteers automatically
+        updated = User.objects.filter(pk=instance.user_id).exclude(
+            role__in=['admin', 'manager', 'volunteer']
+        ).update(role='volunteer')
+        if updated:
+            invalidate_user_list()
+
+@receiver(post_save, sender=User)
+def refresh_admin_emails_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """Drop the cached admin recipient list when a save may have changed it."""
+    if created and instance.role not in ADMIN_ROLES:
+        return
+    if update_fields is None or ADMIN_EMAIL_FIELDS.intersection(update_fields):
+        invalidate_admin_emails()
+
+
+@receiver(post_delete, sender=User)
+def refresh_admin_emails_on_delete(sender, instance, **kwargs):
+    if instance.role in ADMIN_ROLES:
+        invalidate_admin_emails()
+
+
+@receiver(post_save, sender=VolunteerProfile)
+@receiver(post_delete, sender=VolunteerProfile)
+def refresh_volunteer_list(sender, **kwargs):
+    invalidate_volunteer_list()
+
+
+@receiver(post_save, sender=User)
+def refresh_volunteer_list_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    """A new user has no profile yet; otherwise only name/email changes show in the list."""
+    if created:
+        return
+    if update_fields is None or VOLUNTEER_LIST_USER_FIELDS.intersection(update_fields):
+        invalidate_volunteer_list()
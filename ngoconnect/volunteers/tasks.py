@@ -0,0 +1,23 @@
+# volunteers/tasks.py
+from celery import shared_task
+from user.email_service import EmailService
+from user.tasks import EMAIL_TASK_OPTIONS, send_to_each_recipient
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def notify_admins_of_application(self, applicant_name, applicant_email, recipient_emails):
+    """Send the new-application notice to every admin/manager over one SMTP connection."""
+    send_to_each_recipient(
+        self,
+        recipient_emails,
+        lambda recipient_email, connection: EmailService.send_volunteer_application_notification(
+            applicant_name, applicant_email, recipient_email, connection=connection
+        ),
+        retry_args=(applicant_name, applicant_email),
+    )
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_volunteer_status_update_task(self, applicant_email, applicant_name, new_status):
+    if not EmailService.send_volunteer_status_update(applicant_email, applicant_name, new_status):
+        raise self.retry()
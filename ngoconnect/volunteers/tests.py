@@ -1,3 +1,99 @@
+import json
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from user.models import User
+
+from .models import VolunteerProfile
+
+TEST_PASSWORD = 'Str0ng!pass9'  # nosec
+
+
+class AdminVolunteerReviewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password=TEST_PASSWORD, role='admin', is_active=True
+        )
+        self.applicant = User.objects.create_user(
+            email='applicant@example.com', password=TEST_PASSWORD, first_name='Ada', last_name='L', is_active=True
+        )
+        self.profile = VolunteerProfile.objects.create(user=self.applicant, skills='first aid', availability='weekends')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.url = reverse('admin_volunteer_detail', args=[self.applicant.pk])
+
+    def patch(self, body):
+        return self.client.patch(self.url, json.dumps(body), content_type='application/json')
+
+    def test_invalid_bodies_return_400(self):
+        cases = [
+            ({}, {'application_status': ['This field is required.']}),
+            ({'application_status': None}, {'application_status': ['This field may not be null.']}),
+            ({'application_status': 'PENDING'}, {'application_status': ['"PENDING" is not a valid choice.']}),
+            ({'application_status': ''}, {'application_status': ['"" is not a valid choice.']}),
+            (['APPROVED'], {'non_field_errors': ['Invalid data. Expected a dictionary, but got list.']}),
+            ('APPROVED', {'non_field_errors': ['Invalid data. Expected a dictionary, but got str.']}),
+            (1, {'non_field_errors': ['Invalid data. Expected a dictionary, but got int.']}),
+        ]
+        for body, errors in cases:
+            with self.subTest(body=body):
+                response = self.patch(body)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.json(), errors)
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.application_status, 'PENDING')
+
+    def test_approval_updates_status_and_role(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.patch({'application_status': 'APPROVED'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['application_status'], 'APPROVED')
+        # The status e-mail is queued once the transaction commits
+        self.assertEqual(len(callbacks), 1)
+        self.applicant.refresh_from_db()
+        self.assertEqual(self.applicant.role, 'volunteer')
+
+    def test_unknown_volunteer_returns_404(self):
+        url = reverse('admin_volunteer_detail', args=[self.admin.pk])
+        response = self.client.patch(url, {'application_status': 'APPROVED'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+
+class AdminVolunteerListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password=TEST_PASSWORD, role='admin', is_active=True
+        )
+        self.applicant = User.objects.create_user(
+            email='applicant@example.com', password=TEST_PASSWORD, is_active=True
+        )
+        self.profile = VolunteerProfile.objects.create(user=self.applicant, skills='first aid', availability='weekends')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def skills(self, **params):
+        response = self.client.get(reverse('admin_volunteer_list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row['skills'] for row in response.data['results']]
+
+    def test_list_is_cached_until_a_profile_save(self):
+        self.assertEqual(self.skills(), ['first aid'])
+
+        # Served from the cache: a write that fires no signal isn't visible yet
+        VolunteerProfile.objects.filter(pk=self.profile.pk).update(skills='cooking')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.skills(), ['first aid'])
+
+        self.profile.skills = 'driving'
+        self.profile.save()
+        self.assertEqual(self.skills(), ['driving'])
 
-# Create your tests here.
+    def test_status_filters_are_cached_separately(self):
+        self.assertEqual(self.skills(status='pending'), ['first aid'])
+        self.assertEqual(self.skills(status='approved'), [])
@@ -1,19 +1,32 @@
 # volunteer/views.py
+import functools
+
+from core.pagination import StandardPageNumberPagination
 from core.permissions import IsBusinessAdmin
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Prefetch
+from drf_spectacular.utils import (
+    OpenApiParameter, OpenApiResponse, extend_schema,
+)
+from projects.models import Task
 from rest_framework import serializers, status
+from rest_framework.generics import ListAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from user.email_service import EmailService
-from user.models import User
+from user.cache import get_admin_emails
 
+from .cache import VOLUNTEER_LIST_CACHE_TTL, volunteer_list_cache_key
 from .models import TimeLog, VolunteerProfile
 from .serializers import (
     TimeLogCreateSerializer, TimeLogSerializer, VolunteerAdminDetailSerializer,
     VolunteerAdminSerializer, VolunteerApplySerializer,
     VolunteerProfileSerializer, VolunteerReviewSerializer,
-    VolunteerUpdateSerializer,
+    VolunteerUpdateSerializer, dump_volunteer_admin, validate_review_status,
+)
+from .tasks import (
+    notify_admins_of_application, send_volunteer_status_update_task,
 )
 
 
@@ -32,14 +45,13 @@ class VolunteerApplyView(APIView):
         if serializer.is_valid():
             volunteer = serializer.save()
             
-            # Notify Admins
-            admins = User.objects.filter(role__in=['admin', 'manager'], is_active=True).values_list('email', flat=True)
-            for admin_email in admins:
-                EmailService.send_volunteer_application_notification(
-                    applicant_name=f"{request.user.first_name} {request.user.last_name}",
-                    applicant_email=request.user.email,
-                    recipient_email=admin_email
-                )
+            # Notify Admins (one task, one SMTP connection for all recipients) once committed
+            transaction.on_commit(functools.partial(
+                notify_admins_of_application.delay,
+                applicant_name=f"{request.user.first_name} {request.user.last_name}",
+                applicant_email=request.user.email,
+                recipient_emails=get_admin_emails()
+            ), robust=True)
 
             return Response(
                 VolunteerProfileSerializer(volunteer).data,
@@ -58,7 +70,7 @@ class VolunteerProfileView(APIView):
     )
     def get(self, request):
         try:
-            profile = VolunteerProfile.objects.get(user=request.user)
+            profile = request.user.volunteer_profile
             return Response(VolunteerProfileSerializer(profile).data)
         except VolunteerProfile.DoesNotExist:
             return Response(
@@ -73,7 +85,7 @@ class VolunteerProfileView(APIView):
     )
     def patch(self, request):
         try:
-            profile = VolunteerProfile.objects.get(user=request.user)
+            profile = request.user.volunteer_profile
         except VolunteerProfile.DoesNotExist:
             return Response(
                 {'error': 'You have not applied as a volunteer yet.'},
@@ -87,33 +99,71 @@ class VolunteerProfileView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class AdminVolunteerListView(APIView):
+class AdminVolunteerListView(ListAPIView):
     """Admin: List all volunteer applications."""
     permission_classes = [IsAuthenticated, IsBusinessAdmin]
+    pagination_class = StandardPageNumberPagination
+    serializer_class = VolunteerAdminSerializer
     
-    @extend_schema(
-        summary="List all volunteers (Admin)",
-        responses={200: VolunteerAdminSerializer(many=True)}
-    )
-    def get(self, request):
-        status_filter = request.query_params.get('status', None)
+    def get_queryset(self):
+        status_filter = self.request.query_params.get('status', None)
         
-        volunteers = VolunteerProfile.objects.select_related('user')
+        # Only the columns VolunteerAdminSerializer renders
+        volunteers = VolunteerProfile.objects.select_related('user').only(
+            'application_status', 'skills', 'availability',
+            'user__id', 'user__email', 'user__first_name', 'user__last_name'
+        ).order_by('user_id')
         
         if status_filter:
             volunteers = volunteers.filter(application_status=status_filter.upper())
-        
-        serializer = VolunteerAdminSerializer(volunteers, many=True)
-        return Response(serializer.data)
+        return volunteers
+    
+    def list(self, request, *args, **kwargs):
+        key = volunteer_list_cache_key(
+            request.query_params.get('status'),
+            request.query_params.get(self.paginator.page_query_param)
+        )
+        data = cache.get(key)
+        if data is None:
+            page = self.paginate_queryset(self.get_queryset())
+            data = self.get_paginated_response(dump_volunteer_admin(page)).data
+            cache.set(key, data, VOLUNTEER_LIST_CACHE_TTL)
+        return Response(data)
+    
+    @extend_schema(
+        summary="List all volunteers (Admin)",
+        parameters=[
+            OpenApiParameter(name='status', description='Filter by application status (PENDING, APPROVED, REJECTED)', required=False, type=str),
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
 
 class AdminVolunteerDetailView(APIView):
     """Admin: View and review volunteer application."""
     permission_classes = [IsAuthenticated, IsBusinessAdmin]
     
-    def get_object(self, user_id):
+    def get_object(self, user_id, with_history=False):
+        # Only the columns the admin serializers and the status e-mail use
+        queryset = VolunteerProfile.objects.select_related('user').only(
+            'application_status', 'skills', 'availability',
+            'user__id', 'user__email', 'user__first_name', 'user__last_name'
+        )
+        if with_history:
+            # Everything VolunteerAdminDetailSerializer walks, in a fixed number of queries
+            queryset = queryset.prefetch_related(
+                Prefetch('user__time_logs', queryset=TimeLog.objects.select_related('task').only(
+                    'id', 'volunteer_id', 'start_time', 'end_time', 'duration_minutes',
+                    'task__id', 'task__title'
+                )),
+                Prefetch('user__assigned_tasks', queryset=Task.objects.select_related('campaign').only(
+                    'id', 'assigned_to_id', 'title', 'due_date', 'is_completed',
+                    'campaign__id', 'campaign__title'
+                )),
+            )
         try:
-            return VolunteerProfile.objects.select_related('user').get(user_id=user_id)
+            return queryset.get(user_id=user_id)
         except VolunteerProfile.DoesNotExist:
             return None
     
@@ -122,7 +172,7 @@ class AdminVolunteerDetailView(APIView):
         responses={200: VolunteerAdminDetailSerializer}
     )
     def get(self, request, user_id):
-        volunteer = self.get_object(user_id)
+        volunteer = self.get_object(user_id, with_history=True)
         if not volunteer:
             return Response({'error': 'Volunteer not found'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -138,29 +188,27 @@ class AdminVolunteerDetailView(APIView):
         if not volunteer:
             return Response({'error': 'Volunteer not found'}, status=status.HTTP_404_NOT_FOUND)
         
-        serializer = VolunteerReviewSerializer(data=request.data)
-        if serializer.is_valid():
-            new_status = serializer.validated_data['application_status']
-            
-            # Logic: Update status AND update User Role if Approved
+        # One choice to check; same errors as VolunteerReviewSerializer without building it
+        new_status, errors = validate_review_status(request.data)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Logic: Update status AND update User Role if Approved.
+        # The role change is done by the sync_user_role signal (one UPDATE,
+        # admins/managers excluded) inside the same transaction.
+        with transaction.atomic():
             volunteer.application_status = new_status
-            volunteer.save()
+            volunteer.save(update_fields=['application_status'])
             
-            if new_status == 'APPROVED':
-                # Only update role if they are not already admin/manager (safety check)
-                if volunteer.user.role not in ['admin', 'manager']:
-                    volunteer.user.role = 'volunteer'
-                    volunteer.user.save()
-            
-            # Notify Volunteer
-            EmailService.send_volunteer_status_update(
+            # Notify Volunteer (after commit, so a rollback sends nothing)
+            transaction.on_commit(functools.partial(
+                send_volunteer_status_update_task.delay,
                 applicant_email=volunteer.user.email,
                 applicant_name=f"{volunteer.user.first_name} {volunteer.user.last_name}",
                 new_status=new_status
-            )
-            
-            return Response(VolunteerAdminSerializer(volunteer).data)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            ), robust=True)
+        
+        return Response(VolunteerAdminSerializer(volunteer).data)
 
 
 # --- Time Log Views ---
@@ -173,9 +221,12 @@ class TimeLogListView(APIView):
         responses={200: TimeLogSerializer(many=True)}
     )
     def get(self, request):
-        logs = TimeLog.objects.filter(volunteer=request.user).select_related('task')
-        serializer = TimeLogSerializer(logs, many=True)
-        return Response(serializer.data)
+        # Plain rows in TimeLogSerializer's shape; skips per-row serialization
+        logs = TimeLog.objects.filter(volunteer=request.user).values(
+            'id', 'task', 'start_time', 'end_time', 'duration_minutes',
+            task_name=F('task__title'),
+        )
+        return Response(list(logs))
     
     @extend_schema(
         summary="Log working hours",